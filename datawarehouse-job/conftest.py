@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the data warehouse test suite
+
+The schema and default hierarchy rules are built once per session (per
+xdist worker) into an in-memory template database; each test restores it
+into its own connection via the backup API (a page copy) instead of
+re-running DDL.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.database.schema import initialize_database
+from src.database.operations import DatabaseOperations
+
+
+@pytest.fixture(scope="session")
+def template_db():
+    """In-memory template database built once per session"""
+    conn = initialize_database(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def table_columns(template_db):
+    """Column names per table, cached once for structure tests"""
+    cursor = template_db.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    return {
+        table: {row[1] for row in template_db.execute(f"PRAGMA table_info({table})")}
+        for (table,) in cursor.fetchall()
+    }
+
+
+@pytest.fixture
+def conn(template_db):
+    """Fresh in-memory copy of the template database for each test"""
+    conn = sqlite3.connect(":memory:")
+    template_db.backup(conn)
+    # Per-connection pragmas are not carried over by the backup; journal
+    # and synchronous tuning don't apply to in-memory databases, but temp
+    # tables would still spill to disk files without temp_store=MEMORY
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_ops(conn):
+    """DatabaseOperations bound to the per-test connection"""
+    return DatabaseOperations(conn)
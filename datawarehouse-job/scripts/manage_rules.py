@@ -21,6 +21,16 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.database.operations import DatabaseOperations
 from src.database.schema import initialize_database
 
+def _tune(conn: sqlite3.Connection) -> None:
+    """Tune a raw read connection: don't fail instantly if a sync holds the
+    write lock, keep temp structures in memory, and give the stats queries a
+    reasonable page cache"""
+    conn.executescript(
+        "PRAGMA busy_timeout=5000;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-20000;"
+    )
+
 class RuleManager:
     """Professional rule management system with YAML support"""
     
@@ -181,35 +191,39 @@ class RuleManager:
             conn = initialize_database(str(self.db_path))
             db_ops = DatabaseOperations(conn)
             
-            # Clear existing rules
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM hierarchy_rules")
-            print("Cleared existing database rules")
-            
-            # Insert new rules
-            rules = rules_data['rules']
-            inserted_count = 0
-            
-            for rule in rules:
-                if not rule.get('active', True):
-                    continue
-                
-                rule_data = {
-                    'rule_name': rule['name'],
-                    'pattern_type': rule['pattern_type'],
-                    'pattern_value': rule['pattern_value'],
-                    'network': rule['mapping']['network'],
-                    'domain': rule['mapping']['domain'],
-                    'placement': rule['mapping']['placement'],
-                    'targeting': rule['mapping']['targeting'],
-                    'special': rule['mapping']['special'],
-                    'priority': rule['priority']
-                }
-                
-                db_ops.add_hierarchy_rule(rule_data)
-                inserted_count += 1
-            
-            conn.commit()
+            # Clear and reload in one transaction: a single commit instead of
+            # one per rule, and the swap is atomic for concurrent readers.
+            # BEGIN IMMEDIATE takes the write lock up front so the reload
+            # can't race another writer mid-way.
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+
+                conn.execute("DELETE FROM hierarchy_rules")
+                print("Cleared existing database rules")
+
+                # Insert new rules
+                rules = rules_data['rules']
+                inserted_count = 0
+
+                for rule in rules:
+                    if not rule.get('active', True):
+                        continue
+
+                    rule_data = {
+                        'rule_name': rule['name'],
+                        'pattern_type': rule['pattern_type'],
+                        'pattern_value': rule['pattern_value'],
+                        'network': rule['mapping']['network'],
+                        'domain': rule['mapping']['domain'],
+                        'placement': rule['mapping']['placement'],
+                        'targeting': rule['mapping']['targeting'],
+                        'special': rule['mapping']['special'],
+                        'priority': rule['priority']
+                    }
+
+                    db_ops.add_hierarchy_rule(rule_data, commit=False)
+                    inserted_count += 1
+
             conn.close()
             
             print(f"SUCCESS: Reloaded {inserted_count} active rules to database")
@@ -331,17 +345,16 @@ class RuleManager:
             # Database stats
             if self.db_path.exists():
                 conn = sqlite3.connect(str(self.db_path))
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT COUNT(*) FROM hierarchy_rules")
-                db_rule_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM campaigns")
-                campaign_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM campaign_hierarchy")
-                mapped_campaigns = cursor.fetchone()[0]
-                
+                _tune(conn)
+
+                # One statement and one row instead of a cursor allocation
+                # plus a round-trip per count
+                db_rule_count, campaign_count, mapped_campaigns = conn.execute("""
+                    SELECT (SELECT COUNT(*) FROM hierarchy_rules),
+                           (SELECT COUNT(*) FROM campaigns),
+                           (SELECT COUNT(*) FROM campaign_hierarchy)
+                """).fetchone()
+
                 conn.close()
                 
                 stats['database'] = {
@@ -3,24 +3,34 @@
 Base API client with shared functionality for authentication, retries, and error handling
 """
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 import time
 from datetime import datetime, timezone
 
 class BaseApiClient:
     """Base class for all API clients with shared functionality"""
-    
+
     def __init__(self, base_url: str, bearer_token: str, timeout: int = 30):
         self.base_url = base_url.rstrip('/')
         self.bearer_token = bearer_token
         self.timeout = timeout
         self.session = requests.Session()
-        
+
+        # Pooled adapter so concurrent requests reuse keep-alive connections
+        # instead of paying a TLS handshake each; status-code retries stay in
+        # _make_request so they are not applied twice
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Set default headers
         self.session.headers.update({
             'Authorization': f'Bearer {bearer_token}',
             'Accept': 'application/json, text/plain, */*',
+            'Accept-Encoding': 'gzip, deflate',
             'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive',
             'User-Agent': 'PeachAI-DataWarehouse/1.0'
         })
     
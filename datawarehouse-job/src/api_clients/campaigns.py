@@ -2,41 +2,88 @@
 """
 Campaign API client for fetching campaign data
 """
-from typing import List, Dict, Any
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 from .base_client import BaseApiClient
 
+# On-disk cache for the campaigns list, shared across sync processes
+CACHE_DIR = Path.home() / '.cache' / 'peachai'
+
 class CampaignsClient(BaseApiClient):
     """Client for campaigns API endpoint"""
-    
-    def get_campaigns(self) -> List[Dict[str, Any]]:
+
+    def get_campaigns(self, cache_ttl: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch all campaigns from the API
-        
+
+        Args:
+            cache_ttl: If set, reuse an on-disk copy of the campaigns list no
+                older than this many seconds instead of calling the API. The
+                list changes rarely, so back-fills syncing month after month
+                can skip the redundant round-trip.
+
         Returns:
             List of campaign dictionaries with fields:
             - id, name, description, tracking_url, is_serving, serving_url
             - traffic_weight, deleted_at, created_at, updated_at, slug, path
         """
+        if cache_ttl:
+            campaigns = self._read_campaigns_cache(cache_ttl)
+            if campaigns is not None:
+                print(f"Using cached campaigns list ({len(campaigns)} campaigns)")
+                return campaigns
+
         try:
             campaigns = self.get('/admin/campaigns')
-            
+
             if not isinstance(campaigns, list):
                 raise ValueError("Expected list of campaigns from API")
-            
+
             print(f"Fetched {len(campaigns)} campaigns from API")
-            
+
             # Validate campaign data structure
             for i, campaign in enumerate(campaigns):
                 required_fields = ['id', 'name', 'created_at', 'updated_at']
                 for field in required_fields:
                     if field not in campaign:
                         raise ValueError(f"Campaign {i} missing required field: {field}")
-            
+
+            if cache_ttl:
+                self._write_campaigns_cache(campaigns)
+
             return campaigns
-            
+
         except Exception as e:
             print(f"Error fetching campaigns: {e}")
             raise
+
+    def _campaigns_cache_path(self) -> Path:
+        """Cache file path keyed by base URL so environments don't collide"""
+        key = hashlib.md5(self.base_url.encode()).hexdigest()[:12]
+        return CACHE_DIR / f"campaigns-{key}.json"
+
+    def _read_campaigns_cache(self, ttl: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached campaigns list if fresh enough, else None"""
+        path = self._campaigns_cache_path()
+        try:
+            if path.exists() and (time.time() - path.stat().st_mtime) < ttl:
+                with open(path) as f:
+                    return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+        return None
+
+    def _write_campaigns_cache(self, campaigns: List[Dict[str, Any]]) -> None:
+        """Write the campaigns list to the on-disk cache; failures are non-fatal"""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._campaigns_cache_path(), 'w') as f:
+                json.dump(campaigns, f)
+        except OSError:
+            pass
     
     def get_campaign_by_id(self, campaign_id: int) -> Dict[str, Any]:
         """
@@ -4,6 +4,8 @@ Metrics API client for fetching time-series metrics data
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
 import time
 from .base_client import BaseApiClient
 
@@ -153,34 +155,49 @@ class MetricsClient(BaseApiClient):
             campaign_ids=campaign_ids
         )
     
-    def process_metrics_for_date_range(self, campaign_ids: List[int], start_time_ms: int, end_time_ms: int) -> List[Dict[str, Any]]:
+    def process_metrics_for_date_range(self, campaign_ids: List[int], start_time_ms: int,
+                                       end_time_ms: int, max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Fetch and process metrics for a specific date range for database storage
-        
+
+        The per-campaign requests are independent and HTTP-RTT-bound, so they
+        are fetched concurrently on a thread pool over the shared session.
+
         Args:
             campaign_ids: List of campaign IDs to fetch metrics for individually
             start_time_ms: Start time in milliseconds (UTC)
             end_time_ms: End time in milliseconds (UTC)
-            
+            max_workers: Maximum concurrent metric requests
+
         Returns:
             List of processed hourly data records ready for database insertion
         """
         try:
             processed_records = []
             successful_campaigns = 0
-            
-            # Fetch metrics for each campaign individually to get campaign-specific data
-            for campaign_id in campaign_ids:
-                try:
-                    # Fetch metrics for this specific campaign within the date range
-                    raw_buckets = self.get_metrics(
-                        start_time=start_time_ms,
-                        end_time=end_time_ms,
-                        bucket="one_hour",
-                        metrics="registrations,payment_methods",
-                        campaign_ids=[campaign_id]
-                    )
-                    
+
+            def fetch_campaign(campaign_id: int) -> List[Dict[str, Any]]:
+                return self.get_metrics(
+                    start_time=start_time_ms,
+                    end_time=end_time_ms,
+                    bucket="one_hour",
+                    metrics="registrations,payment_methods",
+                    campaign_ids=[campaign_id]
+                )
+
+            # Fetch metrics for each campaign individually to get campaign-specific
+            # data; collect results in submission order so output matches the
+            # old sequential loop
+            with ThreadPoolExecutor(max_workers=min(max_workers, max(len(campaign_ids), 1))) as executor:
+                futures = [(cid, executor.submit(fetch_campaign, cid)) for cid in campaign_ids]
+
+                for campaign_id, future in futures:
+                    try:
+                        raw_buckets = future.result()
+                    except Exception as e:
+                        print(f"Error fetching metrics for campaign {campaign_id}: {e}")
+                        continue
+
                     if raw_buckets:
                         # Process each bucket for this campaign
                         for bucket in raw_buckets:
@@ -193,18 +210,64 @@ class MetricsClient(BaseApiClient):
                         successful_campaigns += 1
                     else:
                         print(f"No data returned for campaign {campaign_id}")
-                    
-                except Exception as e:
-                    print(f"Error fetching metrics for campaign {campaign_id}: {e}")
-                    continue
-            
+
             print(f"Processed {len(processed_records)} metric records for {successful_campaigns}/{len(campaign_ids)} campaigns")
             return processed_records
-            
+
         except Exception as e:
             print(f"Error fetching metrics for campaigns: {e}")
             return []
 
+    def iter_metrics_for_date_range(self, campaign_ids: List[int], start_time_ms: int,
+                                    end_time_ms: int, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """
+        Stream processed hourly records for a date range as fetches complete
+
+        Generator counterpart to process_metrics_for_date_range for callers
+        that insert records as they arrive: peak memory stays at one
+        campaign's buckets instead of the whole month, and database writes
+        overlap with the remaining API fetches.
+
+        Args:
+            campaign_ids: List of campaign IDs to fetch metrics for individually
+            start_time_ms: Start time in milliseconds (UTC)
+            end_time_ms: End time in milliseconds (UTC)
+            max_workers: Maximum concurrent metric requests
+
+        Yields:
+            Processed hourly data records ready for database insertion
+        """
+        def fetch_campaign(campaign_id: int) -> List[Dict[str, Any]]:
+            return self.get_metrics(
+                start_time=start_time_ms,
+                end_time=end_time_ms,
+                bucket="one_hour",
+                metrics="registrations,payment_methods",
+                campaign_ids=[campaign_id]
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(campaign_ids), 1))) as executor:
+            futures = {executor.submit(fetch_campaign, cid): cid for cid in campaign_ids}
+
+            for future in as_completed(futures):
+                campaign_id = futures[future]
+                try:
+                    raw_buckets = future.result()
+                except Exception as e:
+                    print(f"Error fetching metrics for campaign {campaign_id}: {e}")
+                    continue
+
+                if not raw_buckets:
+                    print(f"No data returned for campaign {campaign_id}")
+                    continue
+
+                for bucket in raw_buckets:
+                    try:
+                        yield self.parse_metrics_bucket(bucket, campaign_id)
+                    except Exception as e:
+                        print(f"Error processing bucket for campaign {campaign_id}: {e}")
+                        continue
+
     def process_metrics_for_storage(self, campaign_ids: List[int], hours_back: int = 24) -> List[Dict[str, Any]]:
         """
         Fetch and process metrics for database storage - campaign-specific approach
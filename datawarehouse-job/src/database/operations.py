@@ -68,11 +68,33 @@ class DatabaseOperations:
         cursor.execute("SELECT * FROM campaigns WHERE id = ?", (campaign_id,))
         row = cursor.fetchone()
         return dict(row) if row else None
+
+    def count_campaigns(self) -> int:
+        """Count campaigns without materializing any rows"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM campaigns")
+        return cursor.fetchone()[0]
+
+    def get_campaign_field(self, campaign_id: int, field: str) -> Any:
+        """Get a single campaign column without materializing the full row"""
+        if field not in {'id', 'name', 'description', 'tracking_url', 'is_serving',
+                         'serving_url', 'traffic_weight', 'deleted_at', 'created_at',
+                         'updated_at', 'slug', 'path', 'sync_timestamp'}:
+            raise ValueError(f"Unknown campaigns column: {field}")
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {field} FROM campaigns WHERE id = ?", (campaign_id,))
+        row = cursor.fetchone()
+        return row[0] if row else None
     
     
     
-    def upsert_hourly_data(self, hourly_data: Dict[str, Any]) -> int:
-        """Insert or update comprehensive hourly data"""
+    def upsert_hourly_data(self, hourly_data: Dict[str, Any], commit: bool = True) -> int:
+        """
+        Insert or update comprehensive hourly data
+
+        Pass commit=False when calling inside an explicit transaction so bulk
+        loads pay a single commit instead of one fsync per record.
+        """
         cursor = self.conn.cursor()
         
         cursor.execute("""
@@ -101,10 +123,95 @@ class DatabaseOperations:
             hourly_data.get('terms_acceptances', 0),
             datetime.now(timezone.utc).isoformat()
         ))
-        
-        self.conn.commit()
+
+        if commit:
+            self.conn.commit()
         return cursor.lastrowid
-    
+
+    def upsert_hourly_data_many(self, records: List[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        Insert or update a batch of hourly data records with a single statement
+
+        executemany lets SQLite prepare the statement once and bind each row in
+        a tight loop instead of re-parsing the SQL per record, which is the
+        difference between per-row and batched inserts on monthly reloads.
+
+        Args:
+            records: Hourly data dicts in upsert_hourly_data format
+            commit: Commit after the batch (pass False inside a wider transaction)
+
+        Returns:
+            Number of records written
+        """
+        rows = self._hourly_data_rows(records)
+
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO hourly_data
+            (campaign_id, unix_hour, credit_cards, email_accounts, google_accounts,
+             sessions, total_accounts, registrations, messages, companion_chats,
+             chat_room_user_chats, total_user_chats, media, payment_methods,
+             converted_users, terms_acceptances, sync_timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        if commit:
+            self.conn.commit()
+        return len(rows)
+
+    def insert_hourly_data_many(self, records: List[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        Insert a batch of hourly data records without conflict handling
+
+        For full reloads where hourly_data was just cleared, the OR REPLACE
+        conflict probe on the composite primary key is pure per-row overhead;
+        plain INSERT skips it.
+
+        Args:
+            records: Hourly data dicts in upsert_hourly_data format
+            commit: Commit after the batch (pass False inside a wider transaction)
+
+        Returns:
+            Number of records written
+        """
+        rows = self._hourly_data_rows(records)
+
+        self.conn.executemany("""
+            INSERT INTO hourly_data
+            (campaign_id, unix_hour, credit_cards, email_accounts, google_accounts,
+             sessions, total_accounts, registrations, messages, companion_chats,
+             chat_room_user_chats, total_user_chats, media, payment_methods,
+             converted_users, terms_acceptances, sync_timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        if commit:
+            self.conn.commit()
+        return len(rows)
+
+    @staticmethod
+    def _hourly_data_rows(records: List[Dict[str, Any]]) -> List[Tuple]:
+        """Build bound parameter rows for the hourly_data batch statements"""
+        sync_timestamp = datetime.now(timezone.utc).isoformat()
+        return [(
+            record['campaign_id'],
+            record['unix_hour'],
+            record.get('credit_cards', 0),
+            record.get('email_accounts', 0),
+            record.get('google_accounts', 0),
+            record.get('sessions', 0),
+            record.get('total_accounts', 0),
+            record.get('registrations', 0),
+            record.get('messages', 0),
+            record.get('companion_chats', 0),
+            record.get('chat_room_user_chats', 0),
+            record.get('total_user_chats', 0),
+            record.get('media', 0),
+            record.get('payment_methods', 0),
+            record.get('converted_users', 0),
+            record.get('terms_acceptances', 0),
+            sync_timestamp
+        ) for record in records]
+
     def get_hourly_data(self, campaign_id: int = None, hour_from: int = None, hour_to: int = None) -> List[Dict[str, Any]]:
         """Get comprehensive hourly data with optional filters"""
         cursor = self.conn.cursor()
@@ -138,12 +245,24 @@ class DatabaseOperations:
     def upsert_campaign_hierarchy(self, hierarchy_data: Dict[str, Any]) -> int:
         """Insert or update campaign hierarchy mapping"""
         cursor = self.conn.cursor()
-        
+
+        # Native upsert instead of INSERT OR REPLACE: the conflict path is a
+        # plain UPDATE, so re-mapping a campaign keeps its surrogate id and
+        # created_at rather than deleting and reinserting the row
         cursor.execute("""
-            INSERT OR REPLACE INTO campaign_hierarchy
+            INSERT INTO campaign_hierarchy
             (campaign_id, campaign_name, network, domain, placement, targeting, special,
              mapping_confidence, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(campaign_id) DO UPDATE SET
+                campaign_name = excluded.campaign_name,
+                network = excluded.network,
+                domain = excluded.domain,
+                placement = excluded.placement,
+                targeting = excluded.targeting,
+                special = excluded.special,
+                mapping_confidence = excluded.mapping_confidence,
+                updated_at = excluded.updated_at
         """, (
             hierarchy_data['campaign_id'],
             hierarchy_data['campaign_name'],
@@ -183,8 +302,13 @@ class DatabaseOperations:
         cursor.execute(query)
         return [dict(row) for row in cursor.fetchall()]
     
-    def add_hierarchy_rule(self, rule_data: Dict[str, Any]) -> int:
-        """Add new hierarchy mapping rule"""
+    def add_hierarchy_rule(self, rule_data: Dict[str, Any], commit: bool = True) -> int:
+        """
+        Add new hierarchy mapping rule
+
+        Pass commit=False when calling inside an explicit transaction so bulk
+        reloads pay a single commit instead of one per rule.
+        """
         cursor = self.conn.cursor()
         
         cursor.execute("""
@@ -204,8 +328,9 @@ class DatabaseOperations:
             rule_data.get('priority', 500),
             rule_data.get('is_active', True)
         ))
-        
-        self.conn.commit()
+
+        if commit:
+            self.conn.commit()
         return cursor.lastrowid
     
     # Sync history operations
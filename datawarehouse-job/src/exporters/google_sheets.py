@@ -4,22 +4,21 @@ Google Sheets Exporter - Export processed data to Google Sheets with formatting
 Supports hierarchical organization, custom formatting, and automatic spreadsheet creation
 """
 import json
+import random
+import sys
+import time
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-try:
-    from google.oauth2.service_account import Credentials
-    from google.auth import default
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-    GOOGLE_SHEETS_AVAILABLE = True
-except ImportError:
-    GOOGLE_SHEETS_AVAILABLE = False
-
 class GoogleSheetsExporter:
     """Export campaign performance data to Google Sheets with hierarchical formatting"""
-    
+
+    # Google API modules, imported lazily on first authenticate() so jobs that
+    # never touch the Sheets path skip the heavy import (protobuf et al.)
+    _google_api = None
+
     def __init__(self, credentials_path: Optional[str] = None):
         """
         Initialize Google Sheets exporter
@@ -29,6 +28,8 @@ class GoogleSheetsExporter:
         """
         self.credentials_path = credentials_path
         self.service = None
+        self._http = None  # Persistent authorized transport shared by all API calls
+        self._fresh_spreadsheets = set()  # IDs created this session that are still empty
         self.scopes = [
             'https://www.googleapis.com/auth/spreadsheets',
             'https://www.googleapis.com/auth/drive'
@@ -50,7 +51,63 @@ class GoogleSheetsExporter:
             {'header': 'Clicks:Reg', 'field': 'clicks_to_reg_ratio', 'width': 100, 'format': 'decimal'},
             {'header': 'Reg:CC', 'field': 'reg_to_cc_ratio', 'width': 80, 'format': 'decimal'}
         ]
-    
+
+        # self.columns is fixed for the life of the exporter, so specialize the
+        # per-campaign row builder once instead of dispatching on column format
+        # for every cell of every row
+        self._build_campaign_row = self._compile_row_builder()
+
+        # Shared empty-cell prefix tuples for hierarchy header rows: deep
+        # hierarchies emit thousands of padding cells, so reuse one tuple per
+        # indent level instead of allocating fresh "" lists every time
+        self._empty_prefixes = [("",) * i for i in range(len(self.columns) + 1)]
+        self._level_labels = tuple(
+            sys.intern(label)
+            for label in ("NETWORK: ", "DOMAIN: ", "PLACEMENT: ", "TARGETING: ", "SPECIAL: ")
+        )
+
+    def _header_row(self, level: int, name: str) -> List[Any]:
+        """Build a hierarchy header row indented to the given level"""
+        return (
+            list(self._empty_prefixes[level])
+            + [f"{self._level_labels[level]}{name}"]
+            + list(self._empty_prefixes[len(self.columns) - level - 1])
+        )
+
+    def _compile_row_builder(self):
+        """
+        Generate a straight-line row-builder function specialized to self.columns
+
+        Emits one literal expression per column (matching the column's format)
+        and execs it into a function, so the export hot loop runs without any
+        per-cell format lookups.
+
+        Returns:
+            Function mapping a campaign dict to a formatted row list
+        """
+        format_templates = {
+            'currency': 'f"${{{v}:.2f}}"',
+            'percentage': 'f"{{{v}:.2f}}%"',
+            'decimal': 'f"{{{v}:.2f}}"',
+            'number': 'int({v})'
+        }
+
+        exprs = []
+        for i, col in enumerate(self.columns):
+            value = f"(v{i} := c.get({col['field']!r}, ''))"
+            fallback = f"(str(v{i}) if v{i} is not None else '')"
+            template = format_templates.get(col.get('format'))
+            if template:
+                formatted = template.format(v=f'v{i}')
+                exprs.append(f"({formatted} if isinstance({value}, (int, float)) else {fallback})")
+            else:
+                exprs.append(f"(str(v{i}) if {value} is not None else '')")
+
+        source = "def _build(c):\n    return [" + ", ".join(exprs) + "]\n"
+        namespace = {}
+        exec(source, namespace)
+        return namespace['_build']
+
     def authenticate(self) -> bool:
         """
         Authenticate with Google Sheets API using service account credentials or Application Default Credentials (ADC)
@@ -58,30 +115,35 @@ class GoogleSheetsExporter:
         Returns:
             True if authentication successful, False otherwise
         """
-        if not GOOGLE_SHEETS_AVAILABLE:
+        api = self._import_google_api()
+        if not api:
             print("ERROR: Google Sheets API not available. Install: pip install google-api-python-client google-auth")
             return False
-        
+
+        # Reuse the existing service (and its warm TCP connection) across exports
+        if self.service:
+            return True
+
         try:
             # Try service account credentials first if path provided
             if self.credentials_path:
                 credentials_file = Path(self.credentials_path)
                 if credentials_file.exists():
                     try:
-                        credentials = Credentials.from_service_account_file(
-                            self.credentials_path, 
+                        credentials = api['Credentials'].from_service_account_file(
+                            self.credentials_path,
                             scopes=self.scopes
                         )
-                        self.service = build('sheets', 'v4', credentials=credentials)
+                        self.service = self._build_service(credentials)
                         print("SUCCESS: Authenticated with Google Sheets API using service account")
                         return True
                     except Exception as e:
                         print(f"WARNING: Service account authentication failed: {e}")
                         print("Falling back to Application Default Credentials...")
-            
+
             # Fall back to Application Default Credentials (ADC)
-            credentials, project = default(scopes=self.scopes)
-            self.service = build('sheets', 'v4', credentials=credentials)
+            credentials, project = api['default'](scopes=self.scopes)
+            self.service = self._build_service(credentials)
             print("SUCCESS: Authenticated with Google Sheets API using Application Default Credentials")
             return True
             
@@ -89,7 +151,89 @@ class GoogleSheetsExporter:
             print(f"ERROR: Failed to authenticate with Google Sheets: {e}")
             print("Make sure you have run 'gcloud auth application-default login'")
             return False
-    
+
+    @classmethod
+    def _import_google_api(cls) -> Optional[Dict[str, Any]]:
+        """
+        Import the Google API stack on first use and cache it on the class
+
+        Returns:
+            Dict of the imported modules/classes, or None if not installed
+        """
+        if cls._google_api is None:
+            try:
+                import httplib2
+                import google_auth_httplib2
+                from google.oauth2.service_account import Credentials
+                from google.auth import default
+                from googleapiclient.discovery import build
+                from googleapiclient.errors import HttpError
+                cls._google_api = {
+                    'httplib2': httplib2,
+                    'google_auth_httplib2': google_auth_httplib2,
+                    'Credentials': Credentials,
+                    'default': default,
+                    'build': build,
+                    'HttpError': HttpError
+                }
+            except ImportError:
+                cls._google_api = False
+        return cls._google_api or None
+
+    @property
+    def _HttpError(self):
+        """HttpError class, available once the Google libs have been imported"""
+        return self._google_api['HttpError'] if self._google_api else Exception
+
+    def _build_service(self, credentials):
+        """
+        Build the Sheets service over a single persistent, gzip-enabled transport
+
+        A multi-tab export fires 6+ sequential HTTPS requests; sharing one
+        keep-alive connection avoids a fresh TCP/TLS handshake per call.
+
+        Args:
+            credentials: Authenticated google-auth credentials
+
+        Returns:
+            Sheets API service bound to the shared transport
+        """
+        api = self._google_api
+        self._http = api['google_auth_httplib2'].AuthorizedHttp(
+            credentials,
+            http=api['httplib2'].Http(timeout=60)
+        )
+        return api['build']('sheets', 'v4', http=self._http, cache_discovery=False)
+
+    def _execute_with_retry(self, request, max_retries: int = 5):
+        """
+        Execute a Sheets API request with exponential backoff on transient errors
+
+        Sheets quotas surface as 429s on large exports; without retries a single
+        rate-limit hit aborts the whole export and forces a full re-run.
+
+        Args:
+            request: Prepared googleapiclient request to execute
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            API response from the successful execution
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return request.execute()
+            except self._HttpError as e:
+                status = e.resp.status if e.resp is not None else None
+                if status not in (429, 500, 502, 503, 504) or attempt == max_retries:
+                    raise
+                retry_after = e.resp.get('retry-after') if e.resp is not None else None
+                if retry_after and str(retry_after).isdigit():
+                    wait_time = float(retry_after)
+                else:
+                    wait_time = min(2 ** attempt + random.random(), 64)
+                print(f"Sheets API returned {status}. Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+
     def create_spreadsheet(self, title: str) -> Optional[str]:
         """
         Create a new Google Spreadsheet
@@ -123,15 +267,16 @@ class GoogleSheetsExporter:
                 }]
             }
             
-            result = self.service.spreadsheets().create(body=spreadsheet_body).execute()
+            result = self._execute_with_retry(self.service.spreadsheets().create(body=spreadsheet_body))
             spreadsheet_id = result['spreadsheetId']
-            
+            self._fresh_spreadsheets.add(spreadsheet_id)
+
             print(f"SUCCESS: Created spreadsheet '{title}' with ID: {spreadsheet_id}")
             print(f"Spreadsheet URL: https://docs.google.com/spreadsheets/d/{spreadsheet_id}")
             
             return spreadsheet_id
             
-        except HttpError as e:
+        except self._HttpError as e:
             print(f"ERROR: Failed to create spreadsheet: {e}")
             return None
     
@@ -147,88 +292,46 @@ class GoogleSheetsExporter:
         """
         if not data:
             return []
-        
-        # Group data by hierarchy levels
-        hierarchy_groups = {}
-        
+
+        # Group in a single pass: one flat dict keyed by the full 5-level
+        # hierarchy tuple (one hash per campaign instead of five nested checks)
+        hierarchy_groups = defaultdict(list)
+
         for campaign in data:
-            network = campaign.get('network', 'Unknown')
-            domain = campaign.get('domain', 'Unknown')
-            placement = campaign.get('placement', 'Unknown')
-            targeting = campaign.get('targeting', 'Unknown')
-            special = campaign.get('special', 'Unknown')
-            
-            # Create nested structure
-            if network not in hierarchy_groups:
-                hierarchy_groups[network] = {}
-            if domain not in hierarchy_groups[network]:
-                hierarchy_groups[network][domain] = {}
-            if placement not in hierarchy_groups[network][domain]:
-                hierarchy_groups[network][domain][placement] = {}
-            if targeting not in hierarchy_groups[network][domain][placement]:
-                hierarchy_groups[network][domain][placement][targeting] = {}
-            if special not in hierarchy_groups[network][domain][placement][targeting]:
-                hierarchy_groups[network][domain][placement][targeting][special] = []
-            
-            hierarchy_groups[network][domain][placement][targeting][special].append(campaign)
-        
+            hierarchy_groups[(
+                campaign.get('network', 'Unknown'),
+                campaign.get('domain', 'Unknown'),
+                campaign.get('placement', 'Unknown'),
+                campaign.get('targeting', 'Unknown'),
+                campaign.get('special', 'Unknown')
+            )].append(campaign)
+
         # Build rows with hierarchical headers
         rows = []
-        
+
         # Add header row
         header_row = [col['header'] for col in self.columns]
         rows.append(header_row)
-        
-        # Add hierarchical data rows
-        for network in sorted(hierarchy_groups.keys()):
-            # Network header
-            network_row = [f"NETWORK: {network}"] + [""] * (len(self.columns) - 1)
-            rows.append(network_row)
-            
-            for domain in sorted(hierarchy_groups[network].keys()):
-                # Domain header (indented)
-                domain_row = ["", f"DOMAIN: {domain}"] + [""] * (len(self.columns) - 2)
-                rows.append(domain_row)
-                
-                for placement in sorted(hierarchy_groups[network][domain].keys()):
-                    # Placement header (more indented)
-                    placement_row = ["", "", f"PLACEMENT: {placement}"] + [""] * (len(self.columns) - 3)
-                    rows.append(placement_row)
-                    
-                    for targeting in sorted(hierarchy_groups[network][domain][placement].keys()):
-                        # Targeting header (more indented)
-                        targeting_row = ["", "", "", f"TARGETING: {targeting}"] + [""] * (len(self.columns) - 4)
-                        rows.append(targeting_row)
-                        
-                        for special in sorted(hierarchy_groups[network][domain][placement][targeting].keys()):
-                            # Special header (most indented)
-                            special_row = ["", "", "", "", f"SPECIAL: {special}"] + [""] * (len(self.columns) - 5)
-                            rows.append(special_row)
-                            
-                            # Campaign data rows
-                            campaigns = hierarchy_groups[network][domain][placement][targeting][special]
-                            for campaign in sorted(campaigns, key=lambda x: x.get('campaign_name', '')):
-                                campaign_row = []
-                                for col in self.columns:
-                                    value = campaign.get(col['field'], '')
-                                    
-                                    # Format values based on column type
-                                    if col.get('format') == 'currency' and isinstance(value, (int, float)):
-                                        campaign_row.append(f"${value:.2f}")
-                                    elif col.get('format') == 'percentage' and isinstance(value, (int, float)):
-                                        campaign_row.append(f"{value:.2f}%")
-                                    elif col.get('format') == 'decimal' and isinstance(value, (int, float)):
-                                        campaign_row.append(f"{value:.2f}")
-                                    elif col.get('format') == 'number' and isinstance(value, (int, float)):
-                                        campaign_row.append(int(value))
-                                    else:
-                                        campaign_row.append(str(value) if value is not None else '')
-                                
-                                rows.append(campaign_row)
-                            
-                            # Add spacing after each special group
-                            rows.append([""] * len(self.columns))
-        
+
+        # Sorting the 5-tuples reproduces the nested per-level sort order;
+        # emit header rows from the first level where the key changes
+        previous_key = None
+        for key, campaigns in sorted(hierarchy_groups.items()):
+            changed_level = 0
+            if previous_key is not None:
+                while changed_level < 5 and key[changed_level] == previous_key[changed_level]:
+                    changed_level += 1
+            for level in range(changed_level, 5):
+                rows.append(self._header_row(level, key[level]))
+            previous_key = key
+
+            # Campaign data rows
+            for campaign in sorted(campaigns, key=lambda x: x.get('campaign_name', '')):
+                rows.append(self._build_campaign_row(campaign))
+
+            # Add spacing after each special group
+            rows.append(list(self._empty_prefixes[len(self.columns)]))
+
         return rows
     
     def export_campaign_data(self, spreadsheet_id: str, data: List[Dict[str, Any]]) -> bool:
@@ -255,14 +358,15 @@ class GoogleSheetsExporter:
                 print("WARNING: No data to export")
                 return True
             
-            # Clear existing data
-            clear_request = {
-                'range': 'Campaign Performance!A:Z'
-            }
-            self.service.spreadsheets().values().clear(
-                spreadsheetId=spreadsheet_id, 
-                range=clear_request['range']
-            ).execute()
+            # Clear existing data, unless this spreadsheet was just created and
+            # is still empty (the common create-then-export path)
+            if spreadsheet_id in self._fresh_spreadsheets:
+                self._fresh_spreadsheets.discard(spreadsheet_id)
+            else:
+                self._execute_with_retry(self.service.spreadsheets().values().clear(
+                    spreadsheetId=spreadsheet_id,
+                    range='Campaign Performance!A:Z'
+                ))
             
             # Insert new data
             body = {
@@ -270,12 +374,12 @@ class GoogleSheetsExporter:
                 'majorDimension': 'ROWS'
             }
             
-            result = self.service.spreadsheets().values().update(
+            result = self._execute_with_retry(self.service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range='Campaign Performance!A1',
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
+            ))
             
             updated_cells = result.get('updatedCells', 0)
             print(f"SUCCESS: Updated {updated_cells} cells in Google Sheets")
@@ -285,7 +389,7 @@ class GoogleSheetsExporter:
             
             return True
             
-        except HttpError as e:
+        except self._HttpError as e:
             print(f"ERROR: Failed to export data to Google Sheets: {e}")
             return False
     
@@ -359,15 +463,15 @@ class GoogleSheetsExporter:
             # Apply batch updates
             batch_update_request = {'requests': requests}
             
-            self.service.spreadsheets().batchUpdate(
+            self._execute_with_retry(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=batch_update_request
-            ).execute()
+            ))
             
             print("SUCCESS: Applied formatting to spreadsheet")
             return True
             
-        except HttpError as e:
+        except self._HttpError as e:
             print(f"ERROR: Failed to apply formatting: {e}")
             return False
     
@@ -482,7 +586,7 @@ Example usage:
                 ]
             }
             
-            result = self.service.spreadsheets().create(body=spreadsheet_body).execute()
+            result = self._execute_with_retry(self.service.spreadsheets().create(body=spreadsheet_body))
             spreadsheet_id = result['spreadsheetId']
             spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
             
@@ -495,19 +599,23 @@ Example usage:
                 sheet_id = sheet['properties']['sheetId']
                 sheet_ids[sheet_title] = sheet_id
             
-            # Create each tab with date-aware methods
-            self._create_daterange_summary_tab(spreadsheet_id, summary_data, start_date, end_date, sheet_ids)
-            self._create_daterange_daily_tab(spreadsheet_id, daily_data, start_date, end_date, sheet_ids)
-            self._create_daterange_hourly_tab(spreadsheet_id, hourly_data, start_date, end_date, sheet_ids)
-            
+            # Create each tab with date-aware methods; collect the formatting
+            # requests and apply them in one batchUpdate round-trip instead of
+            # one per tab
+            formatting_requests = []
+            formatting_requests += self._create_daterange_summary_tab(spreadsheet_id, summary_data, start_date, end_date, sheet_ids)
+            formatting_requests += self._create_daterange_daily_tab(spreadsheet_id, daily_data, start_date, end_date, sheet_ids)
+            formatting_requests += self._create_daterange_hourly_tab(spreadsheet_id, hourly_data, start_date, end_date, sheet_ids)
+            self._apply_formatting(spreadsheet_id, formatting_requests)
+
             return spreadsheet_url
             
         except Exception as e:
             print(f"ERROR: Failed to create date range export: {e}")
             raise
     
-    def _create_daterange_summary_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> None:
-        """Create date range Performance summary tab"""
+    def _create_daterange_summary_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> List[Dict]:
+        """Create date range Performance summary tab and return its formatting requests"""
         try:
             print(f"Creating Performance Summary tab for {start_date} to {end_date}...")
             
@@ -556,14 +664,14 @@ Example usage:
             sheet_name = f'Performance_Summary_{start_date.replace("-", "")}_to_{end_date.replace("-", "")}'
             self._update_sheet_data(spreadsheet_id, f'{sheet_name}!A1', rows)
             sheet_id = sheet_ids[sheet_name]
-            self._format_summary_sheet(spreadsheet_id, len(rows), len(headers), sheet_id)
-            
+            return self._format_summary_sheet(len(rows), len(headers), sheet_id)
+
         except Exception as e:
             print(f"ERROR: Failed to create date range summary tab: {e}")
             raise
     
-    def _create_daterange_daily_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> None:
-        """Create date range Daily Summary tab"""
+    def _create_daterange_daily_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> List[Dict]:
+        """Create date range Daily Summary tab and return its formatting requests"""
         try:
             print(f"Creating Daily Summary tab for {start_date} to {end_date}...")
             
@@ -594,14 +702,14 @@ Example usage:
             sheet_name = f'Daily_Summary_{start_date.replace("-", "")}_to_{end_date.replace("-", "")}'
             self._update_sheet_data(spreadsheet_id, f'{sheet_name}!A1', rows)
             sheet_id = sheet_ids[sheet_name]
-            self._format_daily_sheet(spreadsheet_id, len(rows), len(headers), sheet_id)
-            
+            return self._format_daily_sheet(len(rows), len(headers), sheet_id)
+
         except Exception as e:
             print(f"ERROR: Failed to create date range daily summary tab: {e}")
             raise
     
-    def _create_daterange_hourly_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> None:
-        """Create date range Hourly Data tab"""
+    def _create_daterange_hourly_tab(self, spreadsheet_id: str, data: List[Dict], start_date: str, end_date: str, sheet_ids: Dict[str, int]) -> List[Dict]:
+        """Create date range Hourly Data tab and return its formatting requests"""
         try:
             print(f"Creating Hourly Data tab for {start_date} to {end_date}...")
             
@@ -630,8 +738,8 @@ Example usage:
             sheet_name = f'Hourly_Data_{start_date.replace("-", "")}_to_{end_date.replace("-", "")}'
             self._update_sheet_data(spreadsheet_id, f'{sheet_name}!A1', rows)
             sheet_id = sheet_ids[sheet_name]
-            self._format_hourly_sheet(spreadsheet_id, len(rows), len(headers), sheet_id)
-            
+            return self._format_hourly_sheet(len(rows), len(headers), sheet_id)
+
         except Exception as e:
             print(f"ERROR: Failed to create date range hourly data tab: {e}")
             raise
@@ -642,115 +750,81 @@ Example usage:
         body = {
             'values': rows
         }
-        self.service.spreadsheets().values().update(
+        self._execute_with_retry(self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption='USER_ENTERED',
             body=body
-        ).execute()
+        ))
     
-    def _format_summary_sheet(self, spreadsheet_id: str, num_rows: int, num_cols: int, sheet_id: int = 0) -> None:
-        """Apply formatting to August Performance tab"""
-        requests = [
+    @staticmethod
+    def _banner_format_request(sheet_id: int, num_cols: int, background: Dict[str, float],
+                               text_format: Dict[str, Any], start_row: int = 0,
+                               end_row: int = 1) -> Dict:
+        """
+        Build a repeatCell request for a full-width banner row
+
+        The per-tab formatters all emit this same shape with different colors;
+        building it in one place keeps the verbose template out of each one.
+        """
+        return {
+            'repeatCell': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': start_row,
+                    'endRowIndex': end_row,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': num_cols
+                },
+                'cell': {
+                    'userEnteredFormat': {
+                        'backgroundColor': background,
+                        'textFormat': text_format
+                    }
+                },
+                'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+            }
+        }
+
+    _WHITE_BOLD = {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+
+    def _format_summary_sheet(self, num_rows: int, num_cols: int, sheet_id: int = 0) -> List[Dict]:
+        """Build formatting requests for the Performance summary tab"""
+        return [
             # Header formatting
-            {
-                'repeatCell': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'startRowIndex': 0,
-                        'endRowIndex': 1,
-                        'startColumnIndex': 0,
-                        'endColumnIndex': num_cols
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 1.0},
-                            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-                        }
-                    },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                }
-            },
+            self._banner_format_request(
+                sheet_id, num_cols, {'red': 0.2, 'green': 0.6, 'blue': 1.0}, self._WHITE_BOLD
+            ),
             # Totals row formatting
-            {
-                'repeatCell': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'startRowIndex': num_rows - 1,
-                        'endRowIndex': num_rows,
-                        'startColumnIndex': 0,
-                        'endColumnIndex': num_cols
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
-                            'textFormat': {'bold': True}
-                        }
-                    },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                }
-            }
+            self._banner_format_request(
+                sheet_id, num_cols, {'red': 0.9, 'green': 0.9, 'blue': 0.9}, {'bold': True},
+                start_row=num_rows - 1, end_row=num_rows
+            )
         ]
-        
-        self._apply_formatting(spreadsheet_id, requests)
-    
-    def _format_daily_sheet(self, spreadsheet_id: str, num_rows: int, num_cols: int, sheet_id: int = 1) -> None:
-        """Apply formatting to Daily Summary tab"""
-        requests = [
-            {
-                'repeatCell': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'startRowIndex': 0,
-                        'endRowIndex': 1,
-                        'startColumnIndex': 0,
-                        'endColumnIndex': num_cols
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': {'red': 0.2, 'green': 0.8, 'blue': 0.6},
-                            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-                        }
-                    },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                }
-            }
+
+    def _format_daily_sheet(self, num_rows: int, num_cols: int, sheet_id: int = 1) -> List[Dict]:
+        """Build formatting requests for the Daily Summary tab"""
+        return [
+            self._banner_format_request(
+                sheet_id, num_cols, {'red': 0.2, 'green': 0.8, 'blue': 0.6}, self._WHITE_BOLD
+            )
         ]
-        
-        self._apply_formatting(spreadsheet_id, requests)
-    
-    def _format_hourly_sheet(self, spreadsheet_id: str, num_rows: int, num_cols: int, sheet_id: int = 2) -> None:
-        """Apply formatting to Hourly Data tab"""
-        requests = [
-            {
-                'repeatCell': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'startRowIndex': 0,
-                        'endRowIndex': 1,
-                        'startColumnIndex': 0,
-                        'endColumnIndex': num_cols
-                    },
-                    'cell': {
-                        'userEnteredFormat': {
-                            'backgroundColor': {'red': 0.8, 'green': 0.6, 'blue': 0.2},
-                            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-                        }
-                    },
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                }
-            }
+
+    def _format_hourly_sheet(self, num_rows: int, num_cols: int, sheet_id: int = 2) -> List[Dict]:
+        """Build formatting requests for the Hourly Data tab"""
+        return [
+            self._banner_format_request(
+                sheet_id, num_cols, {'red': 0.8, 'green': 0.6, 'blue': 0.2}, self._WHITE_BOLD
+            )
         ]
-        
-        self._apply_formatting(spreadsheet_id, requests)
-    
+
     def _apply_formatting(self, spreadsheet_id: str, requests: List[Dict]) -> None:
         """Apply formatting requests to spreadsheet"""
         body = {'requests': requests}
-        self.service.spreadsheets().batchUpdate(
+        self._execute_with_retry(self.service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body=body
-        ).execute()
+        ))
 
 def export_to_google_sheets_simple(data: List[Dict[str, Any]], 
                                  credentials_path: str,
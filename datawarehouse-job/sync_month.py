@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Custom script to sync one month of 2025 data
+
+Parameterized replacement for the per-month sync scripts so optimizations
+to the sync path land in exactly one place.
+"""
+import argparse
+import calendar
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from database.schema import initialize_database
+from database.operations import DatabaseOperations
+from config.settings import get_settings
+from api_clients.campaigns import CampaignsClient
+from api_clients.metrics import MetricsClient
+
+def month_bounds_ms(year: int, month: int) -> tuple:
+    """
+    UTC millisecond timestamps for the start of a month and of the next month
+
+    Uses calendar.timegm directly so backfill loops can compute boundaries
+    without constructing tz-aware datetimes per month.
+    """
+    start_ms = calendar.timegm((year, month, 1, 0, 0, 0, 0, 0, 0)) * 1000
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    end_ms = calendar.timegm((next_year, next_month, 1, 0, 0, 0, 0, 0, 0)) * 1000
+    return start_ms, end_ms
+
+def main(year: int, month: int):
+    month_name = calendar.month_name[month]
+    print(f"Starting {month_name} {year} data sync...")
+
+    # Load settings
+    settings = get_settings()
+    api_config = settings.get_api_config()
+
+    # Initialize database
+    conn = initialize_database("datawarehouse.db")
+    db_ops = DatabaseOperations(conn)
+
+    # Initialize API clients
+    campaigns_client = CampaignsClient(api_config['base_url'], api_config['bearer_token'])
+    metrics_client = MetricsClient(api_config['base_url'], api_config['bearer_token'])
+
+    try:
+        # Step 1: Get campaigns (should be same as before); the list changes
+        # rarely, so month-by-month back-fills reuse a recent cached copy
+        print("\nStep 1: Fetching campaigns...")
+        campaigns = campaigns_client.get_campaigns(cache_ttl=3600)
+        print(f"Found {len(campaigns)} campaigns")
+
+        # Get campaign IDs for metrics
+        campaign_ids = [c['id'] for c in campaigns]
+
+        # Step 2: Fetch and store the month's metrics
+        print(f"\nStep 2: Fetching and storing {month_name} {year} metrics...")
+
+        # First of the month 00:00:00 UTC to first of the next month
+        start_ms, end_ms = month_bounds_ms(year, month)
+
+        print(f"Date range: {datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc)} "
+              f"to {datetime.fromtimestamp(end_ms / 1000, tz=timezone.utc)}")
+        print(f"Timestamp range: {start_ms} to {end_ms}")
+
+        # Stream records into the database as fetches complete instead of
+        # materializing the whole month in memory: clear and reload in a
+        # single transaction (one commit instead of one per record, and the
+        # reload is atomic), inserting in rolling batches so memory stays at
+        # one batch of rows. The table is cleared, so plain INSERT skips the
+        # OR REPLACE conflict probe. Foreign keys stay on: a record for a
+        # campaign missing from the local campaigns table should abort the
+        # reload loudly rather than land silently. If no data came back,
+        # roll back so the existing table is left untouched.
+        batch_size = 500
+        total_records = 0
+        # The connection context manager commits on success and rolls back
+        # on exception; BEGIN IMMEDIATE takes the write lock up front so
+        # the reload can't race another writer mid-way
+        with db_ops.conn:
+            db_ops.conn.execute("BEGIN IMMEDIATE")
+
+            print("Clearing existing hourly data...")
+            db_ops.conn.execute("DELETE FROM hourly_data")
+
+            batch = []
+            for record in metrics_client.iter_metrics_for_date_range(
+                campaign_ids=campaign_ids,
+                start_time_ms=start_ms,
+                end_time_ms=end_ms
+            ):
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    total_records += db_ops.insert_hourly_data_many(batch, commit=False)
+                    batch.clear()
+
+            if batch:
+                total_records += db_ops.insert_hourly_data_many(batch, commit=False)
+
+            if not total_records:
+                # Nothing came back: undo the DELETE so existing data stays
+                db_ops.conn.rollback()
+
+        if total_records:
+            print(f"Stored {total_records} hourly records")
+        else:
+            print(f"No {month_name} metrics data available")
+
+        print(f"\n✅ {month_name} {year} sync completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error during sync: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync one month of hourly metrics data")
+    parser.add_argument("--year", type=int, default=2025, help="Year to sync (default: 2025)")
+    parser.add_argument("--month", type=int, required=True, choices=range(1, 13),
+                        metavar="1-12", help="Month to sync")
+    args = parser.parse_args()
+    main(args.year, args.month)
@@ -200,29 +200,8 @@ class TestAPIClientConfiguration(unittest.TestCase):
             pass
 
 
-def run_tests():
-    """Run all API client tests"""
-    print("Running API Client Tests...")
-    print("=" * 40)
-
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestBaseClient))
-    suite.addTests(loader.loadTestsFromTestCase(TestCampaignsClient))
-    suite.addTests(loader.loadTestsFromTestCase(TestMetricsClient))
-    suite.addTests(loader.loadTestsFromTestCase(TestAPIClientConfiguration))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    # Return success/failure
-    return result.wasSuccessful()
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # Delegate to pytest so direct invocation uses the same collection as
+    # `pytest test_api_clients.py` (and parallelizes with `pytest -n auto`)
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
\ No newline at end of file
@@ -4,10 +4,9 @@ ETL Pipeline tests for Peach AI Data Warehouse
 Tests ETL pipeline components including data processing, hierarchy mapping, and pipeline orchestration
 """
 
-import os
 import sys
+import inspect
 import sqlite3
-import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -19,87 +18,103 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.database.schema import initialize_database
 from src.database.operations import DatabaseOperations
+from src.api_clients.campaigns import CampaignsClient
+from src.api_clients.metrics import MetricsClient
 from src.etl.pipeline import ETLPipeline
 from src.etl.hierarchy_mapper import HierarchyMapper
 from src.etl.data_processor import DataProcessor
 
 
-class TestETLPipeline(unittest.TestCase):
-    """Test ETL pipeline orchestration"""
+class DatabaseTestCase(unittest.TestCase):
+    """Base case giving each test a fresh in-memory copy of a template database
 
-    def setUp(self):
-        """Set up test database and ETL components"""
-        # Create temporary database for testing
-        self.test_db_fd, self.test_db_path = tempfile.mkstemp(suffix='.db')
-        os.close(self.test_db_fd)
+    The schema and default hierarchy rules are built once per class into an
+    in-memory template; each test restores it into its own connection via the
+    backup API (a page copy) instead of re-running DDL against a tempfile.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the in-memory template database once"""
+        cls.template = initialize_database(":memory:")
 
-        # Initialize test database
-        self.conn = initialize_database(self.test_db_path)
+    @classmethod
+    def tearDownClass(cls):
+        cls.template.close()
+
+    def setUp(self):
+        """Restore the template into a fresh in-memory connection"""
+        self.conn = sqlite3.connect(":memory:")
+        self.template.backup(self.conn)
+        # Per-connection pragmas are not carried over by the backup; journal
+        # and synchronous tuning don't apply to in-memory databases, but temp
+        # tables would still spill to disk files without temp_store=MEMORY
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -20000")
         self.db_ops = DatabaseOperations(self.conn)
 
-        # Initialize ETL pipeline with mock API config
-        self.pipeline = ETLPipeline(
-            db_ops=self.db_ops,
+    def tearDown(self):
+        """Clean up test database"""
+        self.conn.close()
+
+
+class TestETLPipeline(DatabaseTestCase):
+    """Test ETL pipeline orchestration"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one pipeline for the whole class
+
+        These tests never mutate database state, so constructing the
+        pipeline (and its API clients with their HTTP sessions) per test
+        was pure setup cost. The pipeline binds to the template database.
+        """
+        super().setUpClass()
+        cls.pipeline = ETLPipeline(
+            db_ops=DatabaseOperations(cls.template),
             api_base_url="https://test-api.example.com",
             api_token="test-token-123"
         )
 
-    def tearDown(self):
-        """Clean up test database"""
-        if self.conn:
-            self.conn.close()
-        if os.path.exists(self.test_db_path):
-            os.unlink(self.test_db_path)
-
     def test_pipeline_initialization(self):
         """Test pipeline initializes with correct components"""
         self.assertIsNotNone(self.pipeline.db_ops)
         self.assertIsNotNone(self.pipeline.campaigns_client)
         self.assertIsNotNone(self.pipeline.metrics_client)
-        # Check that pipeline has necessary methods
-        self.assertTrue(hasattr(self.pipeline, 'sync_campaigns'))
-        self.assertTrue(hasattr(self.pipeline, 'run_full_sync'))
-
-    def test_sync_methods_exist(self):
-        """Test that sync methods exist on pipeline"""
-        self.assertTrue(hasattr(self.pipeline, 'sync_campaigns'))
-        self.assertTrue(callable(getattr(self.pipeline, 'sync_campaigns')))
 
-        self.assertTrue(hasattr(self.pipeline, 'run_full_sync'))
-        self.assertTrue(callable(getattr(self.pipeline, 'run_full_sync')))
+    def test_interface_contract(self):
+        """Test required methods exist on the pipeline and client classes
+
+        Pure introspection via getattr_static on the classes, so no extra
+        pipeline or API client construction is paid per check.
+        """
+        contract = [
+            (ETLPipeline, 'sync_campaigns'),
+            (ETLPipeline, 'run_full_sync'),
+            (CampaignsClient, 'health_check'),
+            (MetricsClient, 'health_check'),
+        ]
+        for klass, name in contract:
+            attr = inspect.getattr_static(klass, name, None)
+            self.assertTrue(callable(attr), f"{klass.__name__}.{name} should be a method")
 
     def test_pipeline_status_check(self):
         """Test pipeline status checking"""
         # Check that the method exists
-        if hasattr(self.pipeline, 'get_pipeline_status'):
+        if inspect.getattr_static(ETLPipeline, 'get_pipeline_status', None):
             status = self.pipeline.get_pipeline_status()
             self.assertIsInstance(status, dict)
 
-    def test_api_health_checks(self):
-        """Test API health checking"""
-        # Test that health check methods exist on the clients
-        self.assertTrue(hasattr(self.pipeline.campaigns_client, 'health_check'))
-        self.assertTrue(hasattr(self.pipeline.metrics_client, 'health_check'))
-
 
-class TestHierarchyMapper(unittest.TestCase):
+class TestHierarchyMapper(DatabaseTestCase):
     """Test hierarchy mapping functionality"""
 
     def setUp(self):
         """Set up test database and hierarchy mapper"""
-        self.test_db_fd, self.test_db_path = tempfile.mkstemp(suffix='.db')
-        os.close(self.test_db_fd)
-        self.conn = initialize_database(self.test_db_path)
-        self.db_ops = DatabaseOperations(self.conn)
+        super().setUp()
         self.mapper = HierarchyMapper(self.db_ops)
 
-    def tearDown(self):
-        """Clean up test database"""
-        if self.conn:
-            self.conn.close()
-        if os.path.exists(self.test_db_path):
-            os.unlink(self.test_db_path)
-
     def test_mapper_initialization(self):
         """Test hierarchy mapper initializes correctly"""
         self.assertIsNotNone(self.mapper.db_ops)
@@ -114,34 +129,25 @@ class TestHierarchyMapper(unittest.TestCase):
 
     def test_mapper_has_necessary_methods(self):
         """Test that mapper has necessary methods"""
-        # Check for key methods that should exist
+        # Check for key methods that should exist, without touching the instance
         expected_methods = ['map_campaign_hierarchy']
         for method in expected_methods:
-            if hasattr(self.mapper, method):
-                self.assertTrue(callable(getattr(self.mapper, method)))
+            attr = inspect.getattr_static(HierarchyMapper, method, None)
+            if attr is not None:
+                self.assertTrue(callable(attr))
 
 
-class TestDataProcessor(unittest.TestCase):
+class TestDataProcessor(DatabaseTestCase):
     """Test data processing and aggregation functionality"""
 
     def setUp(self):
         """Set up test database and data processor"""
-        self.test_db_fd, self.test_db_path = tempfile.mkstemp(suffix='.db')
-        os.close(self.test_db_fd)
-        self.conn = initialize_database(self.test_db_path)
-        self.db_ops = DatabaseOperations(self.conn)
+        super().setUp()
         self.processor = DataProcessor(self.db_ops)
 
         # Insert test campaign and hourly data
         self._setup_test_data()
 
-    def tearDown(self):
-        """Clean up test database"""
-        if self.conn:
-            self.conn.close()
-        if os.path.exists(self.test_db_path):
-            os.unlink(self.test_db_path)
-
     def _setup_test_data(self):
         """Set up test campaign and hourly data"""
         # Insert test campaign
@@ -153,29 +159,37 @@ class TestDataProcessor(unittest.TestCase):
         }
         self.db_ops.upsert_campaign(campaign_data)
 
-        # Insert hierarchy mapping
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO campaign_hierarchy
-            (campaign_id, campaign_name, network, domain, placement, targeting, special)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (12345, 'Test Campaign', 'Facebook', 'Social Media', 'Desktop', 'Desktop Users', 'Premium'))
-        self.conn.commit()
-
-        # Insert test hourly data
-        test_hours = [
-            (12345, 495000, 100, 10, 5, 20, 15),  # hour 1
-            (12345, 495001, 150, 15, 8, 30, 25),  # hour 2
-            (12345, 495002, 200, 20, 12, 40, 35), # hour 3
-        ]
-
-        for campaign_id, unix_hour, sessions, regs, cc, messages, media in test_hours:
-            cursor.execute("""
-                INSERT INTO hourly_data
-                (campaign_id, unix_hour, sessions, registrations, credit_cards, messages, media)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (campaign_id, unix_hour, sessions, regs, cc, messages, media))
-        self.conn.commit()
+        # Single transaction for the fixture inserts instead of a commit
+        # (an implicit transaction in autocommit mode) per statement. The
+        # fixture rows are consistent by construction, so skip the per-row
+        # FK probe against campaigns; the pragma only takes effect outside
+        # a transaction, hence it brackets the with block.
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            with self.conn:
+                cursor = self.conn.cursor()
+
+                # Insert hierarchy mapping
+                cursor.execute("""
+                    INSERT INTO campaign_hierarchy
+                    (campaign_id, campaign_name, network, domain, placement, targeting, special)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (12345, 'Test Campaign', 'Facebook', 'Social Media', 'Desktop', 'Desktop Users', 'Premium'))
+
+                # Insert test hourly data: one prepared statement for all rows
+                test_hours = [
+                    (12345, 495000, 100, 10, 5, 20, 15),  # hour 1
+                    (12345, 495001, 150, 15, 8, 30, 25),  # hour 2
+                    (12345, 495002, 200, 20, 12, 40, 35), # hour 3
+                ]
+
+                cursor.executemany("""
+                    INSERT INTO hourly_data
+                    (campaign_id, unix_hour, sessions, registrations, credit_cards, messages, media)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, test_hours)
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON")
 
     def test_campaign_performance_aggregation(self):
         """Test campaign performance aggregation"""
@@ -263,23 +277,9 @@ class TestDataProcessor(unittest.TestCase):
             pass
 
 
-class TestETLErrorHandling(unittest.TestCase):
+class TestETLErrorHandling(DatabaseTestCase):
     """Test ETL pipeline error handling and resilience"""
 
-    def setUp(self):
-        """Set up test database"""
-        self.test_db_fd, self.test_db_path = tempfile.mkstemp(suffix='.db')
-        os.close(self.test_db_fd)
-        self.conn = initialize_database(self.test_db_path)
-        self.db_ops = DatabaseOperations(self.conn)
-
-    def tearDown(self):
-        """Clean up test database"""
-        if self.conn:
-            self.conn.close()
-        if os.path.exists(self.test_db_path):
-            os.unlink(self.test_db_path)
-
     def test_database_connection_failure_handling(self):
         """Test handling of database connection failures"""
         # Test with invalid database path
@@ -333,29 +333,9 @@ class TestETLErrorHandling(unittest.TestCase):
         self.assertEqual(history[0]['error_message'], 'Test error message')
 
 
-def run_tests():
-    """Run all ETL pipeline tests"""
-    print("Running ETL Pipeline Tests...")
-    print("=" * 40)
-
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestETLPipeline))
-    suite.addTests(loader.loadTestsFromTestCase(TestHierarchyMapper))
-    suite.addTests(loader.loadTestsFromTestCase(TestDataProcessor))
-    suite.addTests(loader.loadTestsFromTestCase(TestETLErrorHandling))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    # Return success/failure
-    return result.wasSuccessful()
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # Tests are independent (each gets its own in-memory database), so run
+    # them across all cores via pytest-xdist instead of a serial runner
+    import pytest
+
+    sys.exit(pytest.main(["-n", "auto", "-v", __file__]))
\ No newline at end of file